@@ -1,9 +1,20 @@
-import argparse
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
+if TYPE_CHECKING:
+    import argparse
 
-@dataclass
+# Option spellings accepted by the fast path, per subcommand
+_FAST_PATH_CONFIG_FLAGS: Dict[str, Tuple[str, ...]] = {
+    "run": ("--config", "-c"),
+    "load": ("--config", "-c"),
+    "fetch": ("--config",),
+}
+_FAST_PATH_REQUIRES_CONFIG = frozenset({"run", "load"})
+
+
+@dataclass(slots=True)
 class CLIArguments:
     """Parsed CLI arguments."""
 
@@ -19,10 +30,25 @@ class ArgumentParser:
     """Handles command-line argument parsing."""
 
     def __init__(self) -> None:
-        self._parser = self._create_parser()
+        # Subcommand builders; only the one being invoked is normally constructed
+        self._subparser_builders: Dict[str, Callable[[Any, Any], None]] = {
+            "run": self._add_run_parser,
+            "status": self._add_status_parser,
+            "load": self._add_load_parser,
+            "fetch": self._add_fetch_parser,
+        }
+
+    def _create_parser(
+        self, command: Optional[str] = None
+    ) -> "argparse.ArgumentParser":
+        """
+        Create argument parser.
+
+        Only the subparser for ``command`` is built when it is a known
+        subcommand; for ``--help`` or unrecognized input all are registered.
+        """
+        import argparse
 
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser with all options."""
         parser = argparse.ArgumentParser(
             prog="selene",
             description="Advanced data processing pipeline",
@@ -64,6 +90,15 @@ Examples:
         )
 
         # Add subcommands
+        if command in self._subparser_builders:
+            self._subparser_builders[command](subparsers, parent_parser)
+        else:
+            for build in self._subparser_builders.values():
+                build(subparsers, parent_parser)
+
+        return parser
+
+    def _add_run_parser(self, subparsers: Any, parent_parser: Any) -> None:
         run_parser = subparsers.add_parser(
             "run",
             help="Run the data pipeline",
@@ -77,6 +112,7 @@ Examples:
             help="Configuration file",
         )
 
+    def _add_status_parser(self, subparsers: Any, parent_parser: Any) -> None:
         status_parser = subparsers.add_parser(
             "status",
             help="Check the status of the last run",
@@ -88,6 +124,7 @@ Examples:
             help="Show status of the last run",
         )
 
+    def _add_load_parser(self, subparsers: Any, parent_parser: Any) -> None:
         load_parser = subparsers.add_parser(
             "load",
             help="Load data from a source",
@@ -101,6 +138,7 @@ Examples:
             help="Configuration file",
         )
 
+    def _add_fetch_parser(self, subparsers: Any, parent_parser: Any) -> None:
         fetch_parser = subparsers.add_parser(
             "fetch",
             help="Fetch data from API and load to database",
@@ -108,11 +146,16 @@ Examples:
         )
         fetch_parser.add_argument("--config", help="Configuration file")
 
-        return parser
-
     def parse(self, args: Optional[list] = None) -> CLIArguments:
         """Parse command line arguments."""
-        parsed = self._parser.parse_args(args)
+        argv = sys.argv[1:] if args is None else args
+
+        fast = self._fast_parse(argv)
+        if fast is not None:
+            return fast
+
+        parser = self._create_parser(argv[0] if argv else None)
+        parsed = parser.parse_args(argv)
 
         # Create a dictionary for command-specific options
         options = {}
@@ -136,3 +179,45 @@ Examples:
             ),
             # options=options
         )
+
+    @staticmethod
+    def _fast_parse(argv: List[str]) -> Optional[CLIArguments]:
+        """
+        Parse the common ``<command> --config <path> [-v] [-q]`` form without argparse.
+
+        Returns None for anything else (help, ``--output-format``, ``status``,
+        unknown or repeated flags) so the caller falls back to the full parser,
+        which also produces the usual error messages.
+        """
+        if not argv or argv[0] not in _FAST_PATH_CONFIG_FLAGS:
+            return None
+
+        command = argv[0]
+        config_flags = _FAST_PATH_CONFIG_FLAGS[command]
+        config: Optional[str] = None
+        verbose = quiet = False
+
+        i = 1
+        while i < len(argv):
+            arg = argv[i]
+            if arg in ("--verbose", "-v") and not verbose:
+                verbose = True
+            elif arg in ("--quiet", "-q") and not quiet:
+                quiet = True
+            elif arg in config_flags and config is None:
+                if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+                    return None
+                config = argv[i + 1]
+                i += 1
+            elif arg.startswith("--config=") and config is None:
+                config = arg[len("--config=") :]
+            else:
+                return None
+            i += 1
+
+        if config is None and command in _FAST_PATH_REQUIRES_CONFIG:
+            return None
+
+        return CLIArguments(
+            command=command, config=config, verbose=verbose, quiet=quiet
+        )
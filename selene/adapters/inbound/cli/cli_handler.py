@@ -1,10 +1,8 @@
+import logging
 from pathlib import Path
-from typing import Any, Optional
-
-import yaml
+from typing import Any, Optional, Type
 
 from selene.adapters.inbound.cli.argument_parser import ArgumentParser, CLIArguments
-from selene.application.containers.market_data_container import MarketDataContainer
 from selene.infrastructure.logging.logger_factory import AppLoggerFactory
 
 
@@ -14,18 +12,22 @@ class CLIHandler:
     def __init__(self) -> None:
         self.argument_parser = ArgumentParser()
         self.logger_factory = AppLoggerFactory
-        self.logger_factory.initialize(verbose=False, quiet=False)
-        self.logger = self.logger_factory.create_logger(__name__)
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger for this handler; logging is configured once in run()."""
+        return self.logger_factory.create_logger(__name__)
 
     def run(self, args: Optional[list] = None) -> int:
         """Main CLI entry point."""
-        try:
-            parsed_args = self.argument_parser.parse(args)
+        parsed_args = self.argument_parser.parse(args)
 
-            self.logger_factory.update_settings(
-                verbose=parsed_args.verbose, quiet=parsed_args.quiet
-            )
+        # Configure handlers exactly once, with the requested verbosity
+        self.logger_factory.initialize(
+            verbose=parsed_args.verbose, quiet=parsed_args.quiet
+        )
 
+        try:
             self._validate_arguments(parsed_args)
 
             return self._route_command(parsed_args)
@@ -34,7 +36,7 @@ class CLIHandler:
             return self._handle_error(f"Configuration file not found: {e}", 1)
         except ValueError as e:
             return self._handle_error(f"Invalid configuration: {e}", 2)
-        except (OSError, yaml.YAMLError) as e:
+        except (OSError, _yaml_error_type()) as e:
             self.logger.exception("Unhandled exception")
             return self._handle_error(f"Application error: {e}", 3)
 
@@ -48,8 +50,16 @@ class CLIHandler:
             raise FileNotFoundError(f"Configuration file '{args.config}' not found")
 
     def _load_yaml_config(self, config_path: str) -> Any:
-        with open(config_path, "r", encoding="utf-8") as file:
-            config_data = yaml.safe_load(file)
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML built without LibYAML bindings
+            from yaml import SafeLoader  # type: ignore[assignment]
+
+        # LibYAML accepts bytes directly, skipping the text decode step
+        with open(config_path, "rb") as file:
+            config_data = yaml.load(file, Loader=SafeLoader)
 
         return config_data
 
@@ -69,6 +79,11 @@ class CLIHandler:
         if not args.config:
             raise ValueError("Configuration file is required for 'fetch' command")
 
+        # Imported here so other commands don't pay for requests/psycopg2 imports
+        from selene.application.containers.market_data_container import (
+            MarketDataContainer,
+        )
+
         # Create and run application
         container = MarketDataContainer(args.config)
         use_case = container.create_use_case()
@@ -103,3 +118,11 @@ class CLIHandler:
         """Standardized error handling."""
         self.logger.error("❌ %s", message)
         return exit_code
+
+
+def _yaml_error_type() -> Type[Exception]:
+    """Resolve yaml.YAMLError lazily; only evaluated when an error is handled."""
+    import yaml
+
+    error_type: Type[Exception] = yaml.YAMLError
+    return error_type
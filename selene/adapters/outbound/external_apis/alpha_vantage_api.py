@@ -1,45 +1,167 @@
+import logging
+import threading
 import time
-from typing import List
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, cast
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from selene.domains.market_data.value_objects.api_response import APIResponse
 from selene.infrastructure.logging.logger_factory import AppLoggerFactory
 from selene.ports.outbound.market_data_api import MarketDataAPIPort
 
+# Alpha Vantage reports exhausted quotas as HTTP 200 with a single notice key
+THROTTLE_NOTICE_KEYS = frozenset({"Note", "Information"})
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` calls per ``per`` seconds."""
+
+    def __init__(self, rate: float, per: float = 1.0) -> None:
+        self.capacity = max(rate, 1.0)
+        self._fill_rate = rate / per
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Consume a token now and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self._fill_rate
+            )
+            self._last = now
+            # A negative balance queues callers behind earlier reservations
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._fill_rate
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
 
-class AlphaVantageAPI(MarketDataAPIPort):
-    """Implementation of MarketDataAPIPort for Alpha Vantage API."""
 
-    def __init__(self, base_url: str, params: dict):
+class BaseAlphaVantageAPI(MarketDataAPIPort):
+    """Configuration and response handling shared by the Alpha Vantage adapters."""
+
+    def __init__(
+        self,
+        base_url: str,
+        params: dict,
+        max_workers: int = 8,
+        rate_limit_per_minute: Optional[int] = None,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 30.0,
+        retry_attempts: int = 3,
+    ):
         self.base_url = base_url
         self.params = params
+        self.max_workers = max_workers
+        # Short connect timeout fails fast on an unreachable host; just over the
+        # 3s TCP retransmission window so one lost SYN is still retried
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_attempts = retry_attempts
+        # Constant query params, built once; get_market_data appends the symbol
+        self._base_params_items = tuple(
+            (key, value) for key, value in params.items() if key != "symbol"
+        )
+        self.logger = AppLoggerFactory.create_logger(__name__)
+        self._bucket = (
+            _TokenBucket(rate=rate_limit_per_minute, per=60.0)
+            if rate_limit_per_minute
+            else None
+        )
+        self._init_transport()
+
+    @abstractmethod
+    def _init_transport(self) -> None:
+        """Create the HTTP client the adapter fetches with."""
+
+    def _decode_json(self, response: Any) -> Dict[str, Any]:
+        """Decode a JSON response body, preferring orjson on the raw bytes."""
+        try:
+            return cast(Dict[str, Any], orjson.loads(response.content))
+        except orjson.JSONDecodeError:
+            pass  # e.g. non-UTF-8 body; let the client sniff the encoding
+        return cast(Dict[str, Any], response.json())
+
+    def _log_response(self, symbol: str, status_code: int, response: Any) -> None:
+        """Log the response status; the body only at DEBUG."""
+        self.logger.info("Response for %s: %s", symbol, status_code)
+        # .text decodes the whole body, which _decode_json avoids; pay for it
+        # only when the body is actually logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Response body for %s: %s", symbol, response.text)
+
+    def _effective_status(
+        self, symbol: str, status_code: int, data: Dict[str, Any]
+    ) -> int:
+        """Report throttle notices as 429 so they fail fast instead of mapping."""
+        if (
+            status_code == 200
+            and len(data) == 1
+            and data.keys() <= THROTTLE_NOTICE_KEYS
+        ):
+            self.logger.warning("Alpha Vantage throttled %s: %s", symbol, data)
+            return 429
+        return status_code
+
+
+class AlphaVantageAPI(BaseAlphaVantageAPI):
+    """Implementation of MarketDataAPIPort for Alpha Vantage API."""
+
+    def _init_transport(self) -> None:
+        """Create the pooled HTTP session and the bulk-fetch workers."""
         self.session = requests.Session()
         self.session.headers.update(
             {"User-Agent": "selene/1.0", "Accept": "application/json"}
         )
-        self.logger = AppLoggerFactory.create_logger(__name__)
+        # Every call goes to one host: keep a pooled connection per worker so
+        # concurrent fetches reuse TLS sessions, and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_workers,
+            max_retries=Retry(
+                total=self.retry_attempts,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Requests block on the network, so threads overlap well despite the GIL
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="alpha_vantage"
+        )
 
     def get_market_data(self, symbol: str) -> APIResponse:
         """Fetch market data for a given symbol."""
+        if self._bucket is not None:
+            self._bucket.acquire()
 
         start_time = time.time()
 
         try:
-            request_params = self.params.copy()
-            request_params["symbol"] = symbol
-
             response = self.session.get(
                 self.base_url,
-                params=request_params,
-                timeout=30,
+                params=[*self._base_params_items, ("symbol", symbol)],
+                timeout=(self.connect_timeout, self.read_timeout),
             )
-            self.logger.info("Response: %s %s", response.status_code, response.text)
+            self._log_response(symbol, response.status_code, response)
             execution_time_ms = int((time.time() - start_time) * 1000)
+            data = self._decode_json(response) if response.status_code == 200 else {}
             return APIResponse(
-                status_code=response.status_code,
-                data=response.json() if response.status_code == 200 else {},
-                headers=dict(response.headers),
+                status_code=self._effective_status(symbol, response.status_code, data),
+                data=data,
+                headers=response.headers,
                 execution_time_ms=execution_time_ms,
             )
         except requests.RequestException as e:
@@ -51,8 +173,13 @@ class AlphaVantageAPI(MarketDataAPIPort):
                 execution_time_ms=execution_time_ms,
             )
 
-    def get_bulk_market_data(self, symbols: List[str]) -> APIResponse:
+    def get_bulk_market_data(self, symbols: List[str]) -> List[APIResponse]:
         """Fetch market data for multiple symbols"""
-        # Alpha Vantage doesn't support bulk requests, so we'd need to call sequentially
-        # This is just a placeholder - in practice, you'd implement rate limiting
-        raise NotImplementedError("Bulk requests not supported by Alpha Vantage")
+        # Alpha Vantage has no bulk endpoint; fan single-symbol requests out over
+        # the shared session's connection pool, subject to the rate limit
+        return list(self._executor.map(self.get_market_data, symbols))
+
+    def close(self) -> None:
+        """Shut down the fetch workers and the HTTP session."""
+        self._executor.shutdown(wait=True)
+        self.session.close()
@@ -1,10 +1,23 @@
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from selene.domains.market_data.entities.market_data import DataSource, MarketData
 from selene.ports.outbound.api_data_mapper import DataMapperPort
 
+# Shared fallback for a missing price; Decimal is immutable, so reuse is safe
+_DEC_ZERO = Decimal("0.00")
+
+# strptime fallbacks for timestamps datetime.fromisoformat() does not accept
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+)
+
 
 class DataMapper(DataMapperPort):
     """Safe implementation of DataMapperPort with error handling."""
@@ -25,6 +38,37 @@ class DataMapper(DataMapperPort):
                     "validation_keys": ["Global Quote"],
                 }
             }
+        # Keeping the raw response pins the whole payload on every entity and
+        # writes it to market_data.raw_data; opt in with `keep_raw: true`
+        self._keep_raw = bool(self.schema_mappings["api"].get("keep_raw", False))
+        self._compile_paths()
+
+    def _compile_paths(self) -> None:
+        """Split field paths into a shared prefix and per-field leaf paths"""
+        schema = self.schema_mappings["api"]
+        paths = {
+            field: (
+                tuple(schema[f"{field}_path"]) if schema.get(f"{field}_path") else None
+            )
+            for field in ("price", "volume", "timestamp")
+        }
+
+        # Walk the prefix common to every path once per record; it stops one key
+        # short of the shortest path so each field keeps a non-empty leaf
+        present = [path for path in paths.values() if path]
+        prefix: Tuple[str, ...] = ()
+        if present:
+            for keys in zip(*(path[:-1] for path in present)):
+                if len(set(keys)) != 1:
+                    break
+                prefix += (keys[0],)
+
+        self._root_path = prefix
+        self._price_leaf = paths["price"][len(prefix) :] if paths["price"] else None
+        self._volume_leaf = paths["volume"][len(prefix) :] if paths["volume"] else None
+        self._timestamp_leaf = (
+            paths["timestamp"][len(prefix) :] if paths["timestamp"] else None
+        )
 
     def map_to_market_data(self, api_data: Dict[str, Any], symbol: str) -> MarketData:
         """Safely map API data to MarketData entity"""
@@ -35,21 +79,28 @@ class DataMapper(DataMapperPort):
             raise ValueError(f"API schema validation failed: {validation_errors}")
 
         try:
-            # Extract data with safe navigation
-            schema = self.schema_mappings["api"]
-            price = self._safe_extract_decimal(api_data, schema["price_path"])
-            volume = self._safe_extract_int(api_data, schema["volume_path"])
-            timestamp = self._safe_extract_datetime(api_data, schema["timestamp_path"])
+            # Extract data with safe navigation, resolving the shared root once
+            root = (
+                self._navigate_path(api_data, self._root_path)
+                if self._root_path
+                else api_data
+            )
+            price = self._safe_extract_decimal(root, self._price_leaf)
+            volume = self._safe_extract_int(root, self._volume_leaf)
+            timestamp = self._safe_extract_datetime(root, self._timestamp_leaf)
+            now = datetime.now()
 
             return MarketData(
                 symbol=symbol.upper(),
-                price=price or Decimal("0.00"),
+                price=price or _DEC_ZERO,
                 volume=volume or 0,
                 market_cap=None,  # Not available in this API
                 pe_ratio=None,  # Not available in this API
-                data_timestamp=timestamp or datetime.now(),
+                data_timestamp=timestamp or now,
                 source=DataSource.API,
-                raw_data=api_data,  # Store original for debugging
+                raw_data=api_data if self._keep_raw else {},
+                created_at=now,
+                updated_at=now,
             )
 
         except Exception as e:
@@ -79,7 +130,7 @@ class DataMapper(DataMapperPort):
         return errors
 
     def _safe_extract_decimal(
-        self, data: Dict[str, Any], path: Optional[List[str]]
+        self, data: Dict[str, Any], path: Optional[Sequence[str]]
     ) -> Optional[Decimal]:
         """Safely extract decimal value from nested dictionary"""
         if not path:
@@ -109,7 +160,7 @@ class DataMapper(DataMapperPort):
             return None
 
     def _safe_extract_int(
-        self, data: Dict[str, Any], path: Optional[List[str]]
+        self, data: Dict[str, Any], path: Optional[Sequence[str]]
     ) -> Optional[int]:
         """Safely extract integer value from nested dictionary"""
         if not path:
@@ -135,19 +186,19 @@ class DataMapper(DataMapperPort):
         except (ValueError, TypeError):
             return None
 
-    def _navigate_path(self, data: Dict[str, Any], path: List[str]) -> Any:
+    def _navigate_path(self, data: Dict[str, Any], path: Sequence[str]) -> Any:
         """Navigate a nested dictionary using a path list."""
         value = data
         for key in path:
-            if not isinstance(value, dict) or key not in value:
+            # One subscript per level; missing keys and non-dict nodes both fail
+            try:
+                value = value[key]
+            except (KeyError, TypeError, IndexError):
                 return None
-            value = value[key]
-            # if value is None:
-            #     return None
         return value
 
     def _safe_extract_datetime(
-        self, data: Dict[str, Any], path: Optional[List[str]]
+        self, data: Dict[str, Any], path: Optional[Sequence[str]]
     ) -> Optional[datetime]:
         """Safely extract datetime value from nested dictionary"""
         if not path:
@@ -163,14 +214,13 @@ class DataMapper(DataMapperPort):
                 return value
 
             if isinstance(value, str):
-                for fmt in [
-                    "%Y-%m-%d",
-                    "%Y-%m-%d %H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%S.%f",
-                    "%Y/%m/%d",
-                    "%d/%m/%Y",
-                ]:
+                # ISO dates ("2024-01-31", Alpha Vantage's format) parse in C
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError:
+                    pass
+
+                for fmt in DATE_FORMATS:
                     try:
                         return datetime.strptime(value, fmt)
                     except ValueError:
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Coroutine, List, TypeVar
+
+import httpx
+
+from selene.adapters.outbound.external_apis.alpha_vantage_api import (
+    BaseAlphaVantageAPI,
+)
+from selene.domains.market_data.value_objects.api_response import APIResponse
+
+T = TypeVar("T")
+
+
+class AsyncAlphaVantageAPI(BaseAlphaVantageAPI):
+    """
+    Alpha Vantage adapter that fetches symbols concurrently over HTTP/2.
+
+    All requests are multiplexed as streams on one httpx.AsyncClient, kept
+    for the adapter's lifetime so its connection is reused across calls.
+    At most ``max_workers`` requests are in flight, and rate limiting waits on
+    the event loop rather than blocking a thread.
+    Requires the optional ``http2`` extra (httpx with h2).
+    """
+
+    def _init_transport(self) -> None:
+        """Start the event loop thread that owns the HTTP/2 client."""
+        # The client's connections belong to one loop; a dedicated thread runs
+        # it so callers on any thread, sync or async, share the client
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="alpha_vantage_http2", daemon=True
+        )
+        self._loop_thread.start()
+        self._client = httpx.AsyncClient(
+            # Transport retries cover connection failures only
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=self.retry_attempts,
+                limits=httpx.Limits(
+                    max_connections=self.max_workers,
+                    max_keepalive_connections=self.max_workers,
+                ),
+            ),
+            headers={"User-Agent": "selene/1.0", "Accept": "application/json"},
+            timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+        )
+        # Shared by all calls, so concurrent bulk fetches stay within the limit
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+
+    async def get_market_data_async(self, symbol: str) -> APIResponse:
+        """Fetch market data for a given symbol."""
+        return await asyncio.wrap_future(self._submit(self._fetch(symbol)))
+
+    async def get_bulk_market_data_async(self, symbols: List[str]) -> List[APIResponse]:
+        """Fetch market data for multiple symbols, in the order given."""
+        return await asyncio.wrap_future(self._submit(self._gather(symbols)))
+
+    def get_market_data(self, symbol: str) -> APIResponse:
+        """Synchronous wrapper so the adapter still satisfies MarketDataAPIPort."""
+        return self._submit(self._fetch(symbol)).result()
+
+    def get_bulk_market_data(self, symbols: List[str]) -> List[APIResponse]:
+        """Synchronous wrapper so the adapter still satisfies MarketDataAPIPort."""
+        return self._submit(self._gather(symbols)).result()
+
+    def close(self) -> None:
+        """Close the HTTP/2 client and stop its event loop thread."""
+        if self._loop.is_closed():
+            return
+        self._submit(self._client.aclose()).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+    def _submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule ``coro`` on the client's event loop."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _gather(self, symbols: List[str]) -> List[APIResponse]:
+        async def fetch(symbol: str) -> APIResponse:
+            async with self._semaphore:
+                return await self._fetch(symbol)
+
+        return list(await asyncio.gather(*(fetch(s) for s in symbols)))
+
+    async def _fetch(self, symbol: str) -> APIResponse:
+        if self._bucket is not None:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        start_time = time.time()
+
+        try:
+            response = await self._client.get(
+                self.base_url,
+                params=[*self._base_params_items, ("symbol", symbol)],
+            )
+            self._log_response(symbol, response.status_code, response)
+            execution_time_ms = int((time.time() - start_time) * 1000)
+            data = self._decode_json(response) if response.status_code == 200 else {}
+            return APIResponse(
+                status_code=self._effective_status(symbol, response.status_code, data),
+                data=data,
+                headers=response.headers,
+                execution_time_ms=execution_time_ms,
+            )
+        # A malformed body fails only this symbol, not the whole gather()
+        except (httpx.HTTPError, ValueError) as e:
+            execution_time_ms = int((time.time() - start_time) * 1000)
+            return APIResponse(
+                status_code=500,
+                data={"error": str(e)},
+                headers={},
+                execution_time_ms=execution_time_ms,
+            )
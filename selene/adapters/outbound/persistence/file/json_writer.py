@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import Dict, List
 
+import orjson
+
 
 class WriterInterface:
     """Interface for writing data to files."""
@@ -15,9 +17,10 @@ class JSONWriter(WriterInterface):
 
     def write(self, file_path: str, headers: List[str], data: List[Dict]) -> None:
         """Write data to a JSON file."""
-        import json
-
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(data, jsonfile, indent=2)
+        # orjson serializes straight to UTF-8 bytes; no text-mode re-encoding
+        with open(file_path, "wb") as jsonfile:
+            jsonfile.write(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
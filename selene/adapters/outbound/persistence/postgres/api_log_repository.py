@@ -1,23 +1,42 @@
-import json
 from datetime import datetime, timedelta
-from typing import List
+from typing import Any, Iterator, List
 
+from psycopg2.extras import NamedTupleCursor, execute_values
+
+from selene.adapters.outbound.persistence.postgres.jsonb import to_jsonb
 from selene.domains.market_data.entities.api_log import APILog
 from selene.infrastructure.database.connection_factory import PostgresConnectionFactory
 from selene.ports.outbound.api_log_repository_port import APILogRepositoryPort
 
+API_LOG_COLUMNS = (
+    "id, operation, endpoint, status_code, success, error_message, "
+    "request_data, response_data, execution_time_ms, timestamp"
+)
+
 
 class PostgresAPILogRepository(APILogRepositoryPort):
     """PostgreSQL implementation for API logs"""
 
+    _schema_ready = False
+
     def __init__(self, connection_factory: PostgresConnectionFactory) -> None:
         self.db = connection_factory
-        self._ensure_tables()
 
-    def _ensure_tables(self) -> None:
-        """Create API log tables"""
-        with self.db.get_connection() as conn:
+    @classmethod
+    def ensure_schema(cls, connection_factory: PostgresConnectionFactory) -> None:
+        """Create API log tables
+
+        Runs once per process; later calls return without touching the database.
+        """
+        if cls._schema_ready:
+            return
+
+        with connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
+                if not connection_factory.acquire_schema_lock(cursor, "api_logs"):
+                    cls._schema_ready = True
+                    return
+
                 cursor.execute(
                     """
                     CREATE TABLE IF NOT EXISTS api_logs (
@@ -43,6 +62,8 @@ class PostgresAPILogRepository(APILogRepositoryPort):
                 )
                 conn.commit()
 
+        cls._schema_ready = True
+
     def save(self, log_entry: APILog) -> APILog:
         """Save API log entry"""
         with self.db.get_connection() as conn:
@@ -61,8 +82,8 @@ class PostgresAPILogRepository(APILogRepositoryPort):
                         log_entry.status_code,
                         log_entry.success,
                         log_entry.error_message,
-                        json.dumps(log_entry.request_data),
-                        json.dumps(log_entry.response_data),
+                        to_jsonb(log_entry.request_data),
+                        to_jsonb(log_entry.response_data),
                         log_entry.execution_time_ms,
                         log_entry.timestamp,
                     ),
@@ -76,34 +97,89 @@ class PostgresAPILogRepository(APILogRepositoryPort):
                 conn.commit()
                 return log_entry
 
+    def save_many(self, entries: List[APILog]) -> List[APILog]:
+        """Save API log entries in a single multi-row INSERT"""
+        if not entries:
+            return entries
+
+        rows = [
+            (
+                entry.operation,
+                entry.endpoint,
+                entry.status_code,
+                entry.success,
+                entry.error_message,
+                to_jsonb(entry.request_data),
+                to_jsonb(entry.response_data),
+                entry.execution_time_ms,
+                entry.timestamp,
+            )
+            for entry in entries
+        ]
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cursor:
+                results = execute_values(
+                    cursor,
+                    """
+                    INSERT INTO api_logs
+                    (operation, endpoint, status_code, success, error_message,
+                     request_data, response_data, execution_time_ms, timestamp)
+                    VALUES %s
+                    RETURNING id
+                """,
+                    rows,
+                    page_size=1000,
+                    fetch=True,
+                )
+
+                # RETURNING preserves VALUES order, so ids line up with entries
+                for entry, result in zip(entries, results):
+                    entry.id = result[0]
+                conn.commit()
+                return entries
+
     def find_recent_errors(self, hours: int = 24) -> List[APILog]:
         """Find recent API errors"""
+        return list(self.iter_recent_errors(hours))
+
+    def iter_recent_errors(self, hours: int = 24) -> Iterator[APILog]:
+        """Stream recent API errors from a server-side cursor"""
+        # Rows hold naive client-side datetime.now() values, so the cutoff is
+        # computed on the client too; the session TimeZone cannot shift it
         cutoff_time = datetime.now() - timedelta(hours=hours)
 
         with self.db.get_connection() as conn:
-            with conn.cursor() as cursor:
+            # Named cursor keeps the result set on the server and fetches it
+            # in itersize chunks instead of materializing every row up front
+            with conn.cursor(
+                name="api_logs_recent_errors", cursor_factory=NamedTupleCursor
+            ) as cursor:
+                cursor.itersize = 1000
                 cursor.execute(
-                    """
-                    SELECT * FROM api_logs
-                    WHERE success = FALSE AND timestamp >= %s
+                    f"""
+                    SELECT {API_LOG_COLUMNS} FROM api_logs
+                    WHERE success = FALSE
+                    AND timestamp >= %s
                     ORDER BY timestamp DESC
                 """,
                     (cutoff_time,),
                 )
 
-                return [self._row_to_api_log(row) for row in cursor.fetchall()]
+                for row in cursor:
+                    yield self._row_to_api_log(row)
 
-    def _row_to_api_log(self, row: tuple) -> APILog:
-        """Convert database row to APILog entity"""
+    def _row_to_api_log(self, row: Any) -> APILog:
+        """Convert database row (NamedTupleCursor record) to APILog entity"""
         return APILog(
-            id=row[0],
-            operation=row[1],
-            endpoint=row[2],
-            status_code=row[3],
-            success=row[4],
-            error_message=row[5],
-            request_data=row[6] or {},
-            response_data=row[7] or {},
-            execution_time_ms=row[8],
-            timestamp=row[9],
+            id=row.id,
+            operation=row.operation,
+            endpoint=row.endpoint,
+            status_code=row.status_code,
+            success=row.success,
+            error_message=row.error_message,
+            request_data=row.request_data or {},
+            response_data=row.response_data or {},
+            execution_time_ms=row.execution_time_ms,
+            timestamp=row.timestamp,
         )
@@ -0,0 +1,15 @@
+from typing import Any
+
+import orjson
+from psycopg2.extras import Json
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a value to JSON text for a JSONB column."""
+    # Non-str keys are stringified, matching json.dumps
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def to_jsonb(obj: Any) -> Json:
+    """Wrap a value for binding as a JSONB query parameter."""
+    return Json(obj, dumps=dumps)
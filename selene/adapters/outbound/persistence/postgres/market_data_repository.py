@@ -1,8 +1,11 @@
-import json
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
+from psycopg2.extras import NamedTupleCursor, execute_values
+
+from selene.adapters.outbound.persistence.postgres.jsonb import to_jsonb
 from selene.domains.market_data.entities.market_data import (
     DataSource,
     DataStatus,
@@ -13,18 +16,53 @@ from selene.ports.outbound.market_data_repository_port import (
     MarketDataRepositoryPort,
 )
 
+MARKET_DATA_COLUMNS = (
+    "id, symbol, price, volume, market_cap, pe_ratio, data_timestamp, "
+    "source, status, raw_data, created_at, updated_at"
+)
+# Same row shape, but the raw_data JSONB payload is never sent to the client
+MARKET_DATA_LITE_COLUMNS = MARKET_DATA_COLUMNS.replace("raw_data", "NULL AS raw_data")
+MARKET_DATA_INSERT_COLUMNS = (
+    "symbol, price, volume, market_cap, pe_ratio, data_timestamp, "
+    "source, status, raw_data, created_at, updated_at"
+)
+
+
+@lru_cache(maxsize=None)
+def _data_source(value: str) -> DataSource:
+    """Cached column value -> DataSource lookup for per-row mapping"""
+    return DataSource(value)
+
+
+@lru_cache(maxsize=None)
+def _data_status(value: str) -> DataStatus:
+    """Cached column value -> DataStatus lookup for per-row mapping"""
+    return DataStatus(value)
+
 
 class PostgresMarketDataRepository(MarketDataRepositoryPort):
     """PostgreSQL implementation for MarketData repository"""
 
+    _schema_ready = False
+
     def __init__(self, connection_factory: PostgresConnectionFactory) -> None:
         self.db = connection_factory
-        self._ensure_tables()
 
-    def _ensure_tables(self) -> None:
-        """Create tables if they don't exist"""
-        with self.db.get_connection() as conn:
+    @classmethod
+    def ensure_schema(cls, connection_factory: PostgresConnectionFactory) -> None:
+        """Create tables if they don't exist
+
+        Runs once per process; later calls return without touching the database.
+        """
+        if cls._schema_ready:
+            return
+
+        with connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
+                if not connection_factory.acquire_schema_lock(cursor, "market_data"):
+                    cls._schema_ready = True
+                    return
+
                 cursor.execute(
                     """
                     CREATE TABLE IF NOT EXISTS market_data (
@@ -52,6 +90,8 @@ class PostgresMarketDataRepository(MarketDataRepositoryPort):
                 )
                 conn.commit()
 
+        cls._schema_ready = True
+
     def save(self, market_data: MarketData) -> MarketData:
         """Save market data to PostgreSQL"""
         with self.db.get_connection() as conn:
@@ -77,7 +117,7 @@ class PostgresMarketDataRepository(MarketDataRepositoryPort):
                         market_data.data_timestamp,
                         market_data.source.value,
                         market_data.status.value,
-                        json.dumps(market_data.raw_data),
+                        to_jsonb(market_data.raw_data),
                         market_data.created_at,
                         market_data.updated_at,
                     ),
@@ -91,6 +131,48 @@ class PostgresMarketDataRepository(MarketDataRepositoryPort):
                 conn.commit()
                 return market_data
 
+    def save_bulk(self, items: List[MarketData]) -> List[MarketData]:
+        """Save market data entries in a single multi-row INSERT"""
+        if not items:
+            return items
+
+        rows = [
+            (
+                item.symbol,
+                item.price,
+                item.volume,
+                item.market_cap,
+                item.pe_ratio,
+                item.data_timestamp,
+                item.source.value,
+                item.status.value,
+                to_jsonb(item.raw_data),
+                item.created_at,
+                item.updated_at,
+            )
+            for item in items
+        ]
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cursor:
+                results = execute_values(
+                    cursor,
+                    f"""
+                    INSERT INTO market_data ({MARKET_DATA_INSERT_COLUMNS})
+                    VALUES %s
+                    RETURNING id
+                """,
+                    rows,
+                    page_size=1000,
+                    fetch=True,
+                )
+
+                # RETURNING preserves VALUES order, so ids line up with items
+                for item, result in zip(items, results):
+                    item.id = result[0]
+                conn.commit()
+                return items
+
     def update(self, market_data: MarketData) -> MarketData:
         """Update existing market data"""
         if not market_data.id:
@@ -120,7 +202,7 @@ class PostgresMarketDataRepository(MarketDataRepositoryPort):
                         market_data.data_timestamp,
                         market_data.source.value,
                         market_data.status.value,
-                        json.dumps(market_data.raw_data),
+                        to_jsonb(market_data.raw_data),
                         market_data.updated_at,
                         market_data.id,
                     ),
@@ -131,10 +213,10 @@ class PostgresMarketDataRepository(MarketDataRepositoryPort):
     def find_by_symbol(self, symbol: str) -> Optional[MarketData]:
         """Find latest market data by symbol"""
         with self.db.get_connection() as conn:
-            with conn.cursor() as cursor:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cursor:
                 cursor.execute(
-                    """
-                    SELECT * FROM market_data
+                    f"""
+                    SELECT {MARKET_DATA_COLUMNS} FROM market_data
                     WHERE symbol = %s
                     ORDER BY data_timestamp DESC
                     LIMIT 1
@@ -147,36 +229,78 @@ class PostgresMarketDataRepository(MarketDataRepositoryPort):
                     return self._row_to_market_data(row)
                 return None
 
+    def find_by_symbols(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Find latest market data for several symbols in one query"""
+        if not symbols:
+            return {}
+
+        with self.db.get_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT DISTINCT ON (symbol) {MARKET_DATA_COLUMNS}
+                    FROM market_data
+                    WHERE symbol = ANY(%s)
+                    ORDER BY symbol, data_timestamp DESC
+                """,
+                    (list(symbols),),
+                )
+
+                return {
+                    row.symbol: self._row_to_market_data(row)
+                    for row in cursor.fetchall()
+                }
+
     def find_all_recent(self, hours: int = 24) -> List[MarketData]:
         """Find all recent market data"""
+        return list(self.iter_all_recent(hours))
+
+    def find_all_recent_lite(self, hours: int = 24) -> List[MarketData]:
+        """Find all recent market data without loading raw_data"""
+        return list(self.iter_all_recent(hours, include_raw_data=False))
+
+    def iter_all_recent(
+        self, hours: int = 24, include_raw_data: bool = True
+    ) -> Iterator[MarketData]:
+        """Stream recent market data from a server-side cursor"""
+        # Rows hold naive client-side datetime.now() values, so the cutoff is
+        # computed on the client too; the session TimeZone cannot shift it
         cutoff_time = datetime.now() - timedelta(hours=hours)
 
+        columns = MARKET_DATA_COLUMNS if include_raw_data else MARKET_DATA_LITE_COLUMNS
+
         with self.db.get_connection() as conn:
-            with conn.cursor() as cursor:
+            # Named cursor keeps the result set on the server and fetches it
+            # in itersize chunks instead of materializing every row up front
+            with conn.cursor(
+                name="market_data_recent", cursor_factory=NamedTupleCursor
+            ) as cursor:
+                cursor.itersize = 1000
                 cursor.execute(
-                    """
-                    SELECT * FROM market_data
+                    f"""
+                    SELECT {columns} FROM market_data
                     WHERE data_timestamp >= %s
                     ORDER BY data_timestamp DESC
                 """,
                     (cutoff_time,),
                 )
 
-                return [self._row_to_market_data(row) for row in cursor.fetchall()]
+                for row in cursor:
+                    yield self._row_to_market_data(row)
 
-    def _row_to_market_data(self, row: tuple) -> MarketData:
-        """Convert database row to MarketData entity"""
+    def _row_to_market_data(self, row: Any) -> MarketData:
+        """Convert database row (NamedTupleCursor record) to MarketData entity"""
         return MarketData(
-            id=row[0],
-            symbol=row[1],
-            price=Decimal(str(row[2])),
-            volume=row[3],
-            market_cap=Decimal(str(row[4])) if row[4] else None,
-            pe_ratio=Decimal(str(row[5])) if row[5] else None,
-            data_timestamp=row[6],
-            source=DataSource(row[7]),
-            status=DataStatus(row[8]),
-            raw_data=row[9] or {},
-            created_at=row[10],
-            updated_at=row[11],
+            id=row.id,
+            symbol=row.symbol,
+            price=Decimal(str(row.price)),
+            volume=row.volume,
+            market_cap=Decimal(str(row.market_cap)) if row.market_cap else None,
+            pe_ratio=Decimal(str(row.pe_ratio)) if row.pe_ratio else None,
+            data_timestamp=row.data_timestamp,
+            source=_data_source(row.source),
+            status=_data_status(row.status),
+            raw_data=row.raw_data or {},
+            created_at=row.created_at,
+            updated_at=row.updated_at,
         )
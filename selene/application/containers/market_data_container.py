@@ -1,6 +1,9 @@
-from typing import Optional
+from typing import Optional, Type
 
-from selene.adapters.outbound.external_apis.alpha_vantage_api import AlphaVantageAPI
+from selene.adapters.outbound.external_apis.alpha_vantage_api import (
+    AlphaVantageAPI,
+    BaseAlphaVantageAPI,
+)
 from selene.adapters.outbound.external_apis.api_data_mapper import DataMapper
 from selene.adapters.outbound.persistence.postgres.api_log_repository import (
     PostgresAPILogRepository,
@@ -20,6 +23,7 @@ from selene.infrastructure.configuration.market_data_config import MarketDataCon
 from selene.infrastructure.database.connection_factory import PostgresConnectionFactory
 from selene.infrastructure.database.db_config import DatabaseConnectionConfig
 from selene.infrastructure.logging.logger_factory import AppLoggerFactory
+from selene.ports.outbound.market_data_api import MarketDataAPIPort
 
 
 class MarketDataContainer:
@@ -28,6 +32,10 @@ class MarketDataContainer:
         self._config: Optional[MarketDataConfig] = None
         self._config_loader = ConfigurationLoader(config_path)
         self._logger = AppLoggerFactory.create_logger(__name__)
+        # Built on the first create_use_case() call and reused until cleanup()
+        self._connection_factory: Optional[PostgresConnectionFactory] = None
+        self._api_adapter: Optional[MarketDataAPIPort] = None
+        self._use_case: Optional[FetchMarketDataUseCase] = None
 
     @property
     def config(self) -> MarketDataConfig:
@@ -54,15 +62,33 @@ class MarketDataContainer:
 
     def create_use_case(self) -> FetchMarketDataUseCase:
         """Create use case for fetching market data with all dependencies."""
+        if self._use_case is not None:
+            return self._use_case
+
         config = self.config
 
         # Convert config format and create connection factory
         db_config = self._create_db_config()
+        # The pool is created on first use by ensure_schema below
         self._connection_factory = PostgresConnectionFactory(db_config, self._logger)
-        self._connection_factory.initialize()
+        PostgresMarketDataRepository.ensure_schema(self._connection_factory)
+        PostgresAPILogRepository.ensure_schema(self._connection_factory)
 
         # Create adapters
-        api_adapter = AlphaVantageAPI(config.api.base_url, config.api.params)
+        api_class: Type[BaseAlphaVantageAPI] = AlphaVantageAPI
+        if config.api.http2:
+            # httpx is an optional dependency, only imported when enabled
+            from selene.adapters.outbound.external_apis import async_alpha_vantage_api
+
+            api_class = async_alpha_vantage_api.AsyncAlphaVantageAPI
+
+        api_adapter = self._api_adapter = api_class(
+            config.api.base_url,
+            config.api.params,
+            rate_limit_per_minute=config.api.rate_limit_per_minute,
+            read_timeout=config.api.timeout_seconds,
+            retry_attempts=config.api.retry_attempts,
+        )
         data_mapper = DataMapper(config.schema)
         market_data_repo = PostgresMarketDataRepository(self._connection_factory)
         api_log_repo = PostgresAPILogRepository(self._connection_factory)
@@ -80,14 +106,22 @@ class MarketDataContainer:
         )
 
         # Create use case
-        return FetchMarketDataUseCase(market_data_service)
+        self._use_case = FetchMarketDataUseCase(
+            market_data_service,
+            unit_of_work=self._connection_factory.unit_of_work,
+        )
+        return self._use_case
 
     def cleanup(self) -> None:
         """Clean up resources held by the container"""
-        if (
-            hasattr(self, "_connection_factory")
-            and self._connection_factory is not None
-        ):
+        self._use_case = None
+
+        if self._api_adapter is not None:
+            self._logger.info("Closing API client")
+            self._api_adapter.close()
+            self._api_adapter = None
+
+        if self._connection_factory is not None:
             self._logger.info("Closing database connections")
             self._connection_factory.close()
-            self._connection_factory = None  # type: ignore
+            self._connection_factory = None
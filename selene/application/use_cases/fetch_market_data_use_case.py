@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Optional
 
 from selene.domains.market_data.service.market_data_service import MarketDataService
 
@@ -6,28 +7,34 @@ from selene.domains.market_data.service.market_data_service import MarketDataSer
 class FetchMarketDataUseCase:
     """Use case for fetching market data from API"""
 
-    def __init__(self, market_data_service: MarketDataService):
+    def __init__(
+        self,
+        market_data_service: MarketDataService,
+        unit_of_work: Optional[Callable[[], ContextManager[Any]]] = None,
+    ):
         self.market_data_service = market_data_service
+        # Scopes the whole batch to one database connection when provided
+        self.unit_of_work = unit_of_work
 
     def execute(self) -> Dict[str, Any]:
         """Execute market data fetching"""
+        # Blanks and duplicates are not fetched, so they don't count as requested
+        symbols = self.market_data_service.normalize_symbols(
+            self.market_data_service.symbols
+        )
         try:
             # Fetch and store market data
-            results = self.market_data_service.fetch_and_store_market_data(
-                self.market_data_service.symbols
-            )
+            with self.unit_of_work() if self.unit_of_work else nullcontext():
+                results = self.market_data_service.fetch_and_store_market_data(symbols)
 
             # Add summary
+            counts = results["counts"]
             results["summary"] = {
-                "total_requested": len(self.market_data_service.symbols),
-                "successful_count": len(results["successful"]),
-                "failed_count": len(results["failed"]),
-                "validation_error_count": len(results["validation_errors"]),
-                "success_rate": (
-                    len(results["successful"]) / len(self.market_data_service.symbols)
-                    if self.market_data_service.symbols
-                    else 0
-                ),
+                "total_requested": len(symbols),
+                "successful_count": counts["successful"],
+                "failed_count": counts["failed"],
+                "validation_error_count": counts["validation_errors"],
+                "success_rate": counts["successful"] / len(symbols) if symbols else 0,
             }
 
             return results
@@ -39,7 +46,7 @@ class FetchMarketDataUseCase:
                 "failed": [],
                 "validation_errors": [],
                 "summary": {
-                    "total_requested": len(self.market_data_service.symbols),
+                    "total_requested": len(symbols),
                     "success_rate": 0,
                 },
             }
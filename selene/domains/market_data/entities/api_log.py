@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class APILog:
     """Domain Entity for API operation logging"""
 
@@ -6,6 +6,9 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# Decimal is immutable; comparing against a shared zero skips int coercion
+_ZERO = Decimal("0")
+
 
 class DataSource(Enum):
     API = "API"
@@ -20,7 +23,7 @@ class DataStatus(Enum):
     SAVED = "SAVED"
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     """Domain Entity for API market data"""
 
@@ -40,7 +43,9 @@ class MarketData:
     def __post_init__(self) -> None:
         if self.created_at is None:
             self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # New entities share one clock reading; loaded rows keep their own value
+        if self.updated_at is None:
+            self.updated_at = self.created_at
 
     def validate(self) -> List[str]:
         """Business validation rules"""
@@ -49,16 +54,16 @@ class MarketData:
         if not self.symbol.strip():
             errors.append("Symbol is required")
 
-        if self.price <= 0:
+        if self.price <= _ZERO:
             errors.append("Price must be positive")
 
         if self.volume < 0:
             errors.append("Volume cannot be negative")
 
-        if self.market_cap is not None and self.market_cap <= 0:
+        if self.market_cap is not None and self.market_cap <= _ZERO:
             errors.append("Market cap must be positive if provided")
 
-        if self.pe_ratio is not None and self.pe_ratio <= 0:
+        if self.pe_ratio is not None and self.pe_ratio <= _ZERO:
             errors.append("PE ratio must be positive if provided")
 
         if self.data_timestamp is None:
@@ -71,11 +76,12 @@ class MarketData:
 
     def mark_as_validated(self) -> None:
         """Business behavior"""
-        if self.is_valid():
+        errors = self.validate()
+        if not errors:
             self.status = DataStatus.VALIDATED
             self.updated_at = datetime.now()
         else:
-            raise ValueError(f"Cannot validate: {self.validate()}")
+            raise ValueError(f"Cannot validate: {errors}")
 
     def mark_as_saved(self) -> None:
         """Business behavior"""
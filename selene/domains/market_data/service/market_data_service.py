@@ -1,6 +1,11 @@
-from typing import Any, Dict, List
+import logging
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from selene.domains.market_data.entities.api_log import APILog
+from selene.domains.market_data.entities.market_data import MarketData
+from selene.domains.market_data.value_objects.api_response import APIResponse
 from selene.infrastructure.logging.logger_factory import AppLoggerFactory
 from selene.ports.outbound.api_log_repository_port import (
     APILogRepositoryPort,
@@ -11,6 +16,9 @@ from selene.ports.outbound.market_data_repository_port import (
 from selene.ports.outbound.api_data_mapper import DataMapperPort
 from selene.ports.outbound.market_data_api import MarketDataAPIPort
 
+# API log endpoint for a symbol is ENDPOINT_PREFIX + symbol
+ENDPOINT_PREFIX = "/market/"
+
 
 class MarketDataService:
 
@@ -21,16 +29,29 @@ class MarketDataService:
         market_data_repository: MarketDataRepositoryPort,
         api_log_repository: APILogRepositoryPort,
         symbols: List[str],
+        batch_size: int = 100,
+        keep_details: bool = False,
     ):
         self.api_port = api_port
         self.data_mapper = data_mapper
         self.market_data_repository = market_data_repository
         self.api_log_repository = api_log_repository
         self.symbols = symbols or []
+        # Symbols fetched, mapped and persisted together; bounds buffered rows
+        self.batch_size = max(batch_size, 1)
+        # Per-symbol result entries are only retained when asked for; the
+        # counts are always reported
+        self.keep_details = keep_details
         self.logger = AppLoggerFactory.create_logger(__name__)
+        # One line per API call, written to the batched stats log
+        self.stats_logger = AppLoggerFactory.get_stats_logger()
+        # Per-symbol debug calls are guarded by this flag, refreshed per batch
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
 
     def fetch_and_store_market_data(self, symbols: List[str]) -> Dict[str, Any]:
         """Fetch market data for multiple symbols and store in database."""
+        symbols = self.normalize_symbols(symbols)
+
         self.logger.info(
             "Starting market data fetch for %d symbols: %s", len(symbols), symbols
         )
@@ -39,40 +60,95 @@ class MarketDataService:
             "successful": [],
             "failed": [],
             "validation_errors": [],
+            "counts": Counter(successful=0, failed=0, validation_errors=0),
         }
 
-        for symbol in symbols:
-            try:
-                self.logger.debug("Processing symbol: %s", symbol)
-                self._process_symbol(symbol, results)
-            except (ValueError, KeyError) as e:
-                self.logger.error("Known error processing symbol %s: %s", symbol, e)
-                self._handle_unexpected_error(symbol, e, results)
-            except RuntimeError as e:
-                self.logger.error("Runtime error processing symbol %s: %s", symbol, e)
-                self._handle_unexpected_error(symbol, e, results)
-            except IOError as e:
-                self.logger.error("IO error processing symbol %s: %s", symbol, e)
-                self._handle_unexpected_error(symbol, e, results)
+        batches = [
+            symbols[start : start + self.batch_size]
+            for start in range(0, len(symbols), self.batch_size)
+        ]
+
+        # Fetch the next batch in the background while the current one is
+        # mapped and persisted; database work stays on the calling thread so
+        # it keeps using the caller's unit of work connection
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="market_data_prefetch"
+        ) as prefetcher:
+            upcoming: Optional[Future] = None
+            for index, batch in enumerate(batches):
+                current = upcoming or prefetcher.submit(
+                    self._fetch_bulk_api_data, batch
+                )
+                upcoming = (
+                    prefetcher.submit(self._fetch_bulk_api_data, batches[index + 1])
+                    if index + 1 < len(batches)
+                    else None
+                )
+                self._process_batch(batch, current.result(), results)
 
         self.logger.info(
             "Fetch completed. Success: %d, Failed: %d, Validation errors: %d",
-            len(results["successful"]),
-            len(results["failed"]),
-            len(results["validation_errors"]),
+            results["counts"]["successful"],
+            results["counts"]["failed"],
+            results["counts"]["validation_errors"],
         )
         return results
 
-    def _process_symbol(self, symbol: str, results: Dict[str, Any]) -> None:
+    def normalize_symbols(self, symbols: List[str]) -> List[str]:
+        """Strip symbols and drop blanks and repeats, keeping first-seen order."""
+        unique = list(dict.fromkeys(s.strip() for s in symbols if s and s.strip()))
+        if len(unique) != len(symbols):
+            self.logger.warning(
+                "Ignoring %d blank or duplicate symbols", len(symbols) - len(unique)
+            )
+        return unique
+
+    def _process_batch(
+        self,
+        symbols: List[str],
+        responses: List[Optional[APIResponse]],
+        results: Dict[str, Any],
+    ) -> None:
+        """Map and validate a fetched batch of symbols, then persist it at once."""
+        # Rows are staged per symbol and written in one batch per table
+        pending: List[MarketData] = []
+        log_buffer: List[APILog] = []
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        for symbol, api_response in zip(symbols, responses):
+            try:
+                if self._debug:
+                    self.logger.debug("Processing symbol: %s", symbol)
+                self._process_symbol(symbol, api_response, results, pending, log_buffer)
+            except (ValueError, KeyError, RuntimeError, IOError) as e:
+                self.logger.error(
+                    "%s processing symbol %s: %s", type(e).__name__, symbol, e
+                )
+                self._handle_unexpected_error(symbol, e, results, log_buffer)
+
+        self._flush(pending, log_buffer, results)
+
+    def _process_symbol(
+        self,
+        symbol: str,
+        api_response: Optional[APIResponse],
+        results: Dict[str, Any],
+        pending: List[MarketData],
+        log_buffer: List[APILog],
+    ) -> None:
         """Process a single symbol through the complete pipeline."""
-        # Fetch data from API
-        api_response = self._fetch_api_data(symbol)
+        # Fetch data from API unless the bulk prefetch already did
+        if api_response is None:
+            api_response = self._fetch_api_data(symbol)
         if not api_response:
-            results["failed"].append(symbol)
+            self._record(results, "failed", symbol)
             return
 
+        # Built once and shared by every API log entry for this symbol
+        endpoint = ENDPOINT_PREFIX + symbol
+
         # Log API call
-        self._log_api_call(symbol, api_response)
+        self._log_api_call(endpoint, api_response, log_buffer)
 
         if not api_response.is_successful:
             self._handle_api_error(symbol, api_response, results)
@@ -84,28 +160,55 @@ class MarketDataService:
             if not market_data:
                 return
         except ValueError as e:
-            self._handle_mapping_error(symbol, e, api_response, results)
+            self._handle_mapping_error(
+                symbol, endpoint, e, api_response, results, log_buffer
+            )
             return
 
-        # Save to database
-        self._save_market_data(symbol, market_data, results)
+        # Stage for the bulk insert
+        self._stage_market_data(symbol, market_data, pending)
+
+    def _record(self, results: Dict[str, Any], outcome: str, entry: Any) -> None:
+        """Count a per-symbol outcome, keeping the entry only in detail mode."""
+        results["counts"][outcome] += 1
+        if self.keep_details:
+            results[outcome].append(entry)
+
+    def _fetch_bulk_api_data(self, symbols: List[str]) -> List[Optional[APIResponse]]:
+        """Fetch data for all symbols concurrently, in the order given."""
+        self.logger.debug("Fetching API data for %d symbols", len(symbols))
+        try:
+            return list(self.api_port.get_bulk_market_data(symbols))
+        except (ValueError, KeyError, RuntimeError, IOError) as e:
+            # Retry per symbol so one bad response only fails that symbol
+            self.logger.warning("Bulk fetch failed, fetching individually: %s", e)
+            return [None] * len(symbols)
 
     def _fetch_api_data(self, symbol: str):
         """Fetch data from API for a symbol."""
-        self.logger.debug("Fetching API data for %s", symbol)
+        if self._debug:
+            self.logger.debug("Fetching API data for %s", symbol)
         return self.api_port.get_market_data(symbol)
 
-    def _log_api_call(self, symbol: str, api_response) -> None:
+    def _log_api_call(
+        self, endpoint: str, api_response, log_buffer: List[APILog]
+    ) -> None:
         """Log the API call details."""
         log_entry = APILog(
             operation="fetch_market_data",
-            endpoint=f"/market/{symbol}",
+            endpoint=endpoint,
             status_code=api_response.status_code,
             success=api_response.is_successful,
             response_data=api_response.data,
             execution_time_ms=api_response.execution_time_ms,
         )
-        self.api_log_repository.save(log_entry)
+        log_buffer.append(log_entry)
+        self.stats_logger.info(
+            "%s status=%d time_ms=%s",
+            endpoint,
+            api_response.status_code,
+            api_response.execution_time_ms,
+        )
 
     def _handle_api_error(
         self, symbol: str, api_response, results: Dict[str, Any]
@@ -113,90 +216,110 @@ class MarketDataService:
         """Handle API response errors."""
         error_msg = f"API returned {api_response.status_code}"
         self.logger.warning("API error for %s: %s", symbol, error_msg)
-        results["failed"].append(
-            {
-                "symbol": symbol,
-                "error": error_msg,
-            }
-        )
+        self._record(results, "failed", {"symbol": symbol, "error": error_msg})
 
     def _map_and_validate_data(
         self, symbol: str, api_response, results: Dict[str, Any]
     ):
         """Map API response to domain entity and validate."""
-        self.logger.debug("Mapping and validating data for %s", symbol)
+        if self._debug:
+            self.logger.debug("Mapping and validating data for %s", symbol)
 
         # Map API data to domain entity
         market_data = self.data_mapper.map_to_market_data(api_response.data, symbol)
 
         # Business validation
-        if not market_data.is_valid():
-            validation_errors = market_data.validate()
+        validation_errors = market_data.validate()
+        if validation_errors:
             self.logger.warning(
                 "Validation failed for %s: %s", symbol, validation_errors
             )
-            results["validation_errors"].append(
-                {"symbol": symbol, "errors": validation_errors}
+            self._record(
+                results,
+                "validation_errors",
+                {"symbol": symbol, "errors": validation_errors},
             )
             return None
 
         # Mark as validated
         market_data.mark_as_validated()
-        self.logger.debug("Data validation successful for %s", symbol)
+        if self._debug:
+            self.logger.debug("Data validation successful for %s", symbol)
         return market_data
 
     def _handle_mapping_error(
-        self, symbol: str, error: ValueError, api_response, results: Dict[str, Any]
+        self,
+        symbol: str,
+        endpoint: str,
+        error: ValueError,
+        api_response,
+        results: Dict[str, Any],
+        log_buffer: List[APILog],
     ) -> None:
         """Handle data mapping errors."""
         error_msg = f"Data mapping failed: {str(error)}"
         self.logger.error("Mapping error for %s: %s", symbol, error_msg)
 
-        results["failed"].append(
-            {
-                "symbol": symbol,
-                "error": error_msg,
-            }
-        )
+        self._record(results, "failed", {"symbol": symbol, "error": error_msg})
 
         # Log mapping error
         error_log = APILog(
             operation="data_mapping",
-            endpoint=f"/market/{symbol}",
+            endpoint=endpoint,
             success=False,
             error_message=str(error),
             response_data=api_response.data,
         )
-        self.api_log_repository.save(error_log)
+        log_buffer.append(error_log)
 
-    def _save_market_data(
-        self, symbol: str, market_data, results: Dict[str, Any]
+    def _stage_market_data(
+        self, symbol: str, market_data: MarketData, pending: List[MarketData]
     ) -> None:
-        """Save market data to database."""
-        self.logger.debug("Saving market data for %s", symbol)
+        """Queue validated market data for the bulk insert."""
+        if self._debug:
+            self.logger.debug("Staging market data for %s", symbol)
 
-        # Save to database
-        saved_data = self.market_data_repository.save(market_data)
-        saved_data.mark_as_saved()
-        self.market_data_repository.update(saved_data)
+        # Rows are written already SAVED, so no follow-up UPDATE is needed
+        market_data.mark_as_saved()
+        pending.append(market_data)
 
-        results["successful"].append(saved_data)
-        self.logger.debug("Successfully saved market data for %s", symbol)
+    def _flush(
+        self,
+        pending: List[MarketData],
+        log_buffer: List[APILog],
+        results: Dict[str, Any],
+    ) -> None:
+        """Write staged market data and API logs in one batch each."""
+        try:
+            if pending:
+                saved = self.market_data_repository.save_bulk(pending)
+                results["counts"]["successful"] += len(saved)
+                if self.keep_details:
+                    results["successful"].extend(saved)
+                self.logger.debug("Saved %d market data rows", len(saved))
+        finally:
+            # A failed insert must still leave the batch's audit trail
+            if log_buffer:
+                self.api_log_repository.save_many(log_buffer)
 
     def _handle_unexpected_error(
-        self, symbol: str, error: Exception, results: Dict[str, Any]
+        self,
+        symbol: str,
+        error: Exception,
+        results: Dict[str, Any],
+        log_buffer: List[APILog],
     ) -> None:
         """Handle unexpected errors during processing."""
         error_msg = str(error)
         self.logger.error("Unexpected error for %s: %s", symbol, error_msg)
 
-        results["failed"].append({"symbol": symbol, "error": error_msg})
+        self._record(results, "failed", {"symbol": symbol, "error": error_msg})
 
         # Log unexpected errors
         error_log = APILog(
             operation="fetch_and_store",
-            endpoint=f"/market/{symbol}",
+            endpoint=ENDPOINT_PREFIX + symbol,
             success=False,
             error_message=error_msg,
         )
-        self.api_log_repository.save(error_log)
+        log_buffer.append(error_log)
@@ -1,17 +1,24 @@
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class APIResponse:
     """Value object for API response data"""
 
     status_code: int
     data: Dict[str, Any]
-    headers: Dict[str, str]
+    # Transport header mapping as returned by the client, not copied to a dict
+    headers: Mapping[str, str]
     execution_time_ms: int
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Epoch nanoseconds; datetime.now() per response is built only on demand
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
     @property
     def is_successful(self) -> bool:
@@ -1,8 +1,15 @@
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML bindings
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 from selene.infrastructure.configuration.env_loader import EnvironmentLoader
 from selene.infrastructure.configuration.market_data_config import (
     APIConfig,
@@ -10,6 +17,17 @@ from selene.infrastructure.configuration.market_data_config import (
 )
 from selene.infrastructure.database.db_config import DatabaseConnectionConfig
 
+# (config field, environment variable, YAML key, fallback, type)
+_DATABASE_ENV_SPEC = (
+    ("host", "DB_HOST", "host", "localhost", str),
+    ("port", "DB_PORT", "port", 5432, int),
+    ("database", "DB_NAME", "database", "", str),
+    ("user", "DB_USER", "user", "", str),
+    ("password", "DB_PASSWORD", None, "", str),
+    ("min_connections", "DB_MIN_CONNECTIONS", "min_connection", 5, int),
+    ("max_connections", "DB_MAX_CONNECTIONS", "max_connection", 10, int),
+)
+
 
 class ConfigurationLoader:
     """Loads and validates configuration from YAML files and environment variables"""
@@ -27,8 +45,12 @@ class ConfigurationLoader:
             if not config_file.exists():
                 raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
-            with open(config_file, "r", encoding="utf-8") as file:
-                yaml_config = yaml.safe_load(file)
+            stat = config_file.stat()
+            # The cached parse is shared between loads; callers get their own
+            # copy so mutating a loaded config cannot leak into later loads
+            yaml_config = copy.deepcopy(
+                _parse_yaml(str(config_file.resolve()), stat.st_mtime_ns, stat.st_size)
+            )
 
             # Build typed configuration objects
             config = self._build_config_with_env(yaml_config)
@@ -71,6 +93,7 @@ class ConfigurationLoader:
             timeout_seconds=api_data.get("timeout_seconds", 30),
             retry_attempts=api_data.get("retry_attempts", 3),
             rate_limit_per_minute=api_data.get("rate_limit_per_minute", 60),
+            http2=api_data.get("http2", False),
             symbols=api_data.get("symbols", []),
         )
 
@@ -78,24 +101,7 @@ class ConfigurationLoader:
         db_data = yaml_config.get("database", {})
 
         database_config = DatabaseConnectionConfig(
-            host=self.env_loader.get_secret(
-                "DB_HOST", default=db_data.get("host", "localhost")
-            ),
-            port=self.env_loader.get_int("DB_PORT", default=db_data.get("port", 5432))
-            or 5432,
-            database=self.env_loader.get_secret(
-                "DB_NAME", default=db_data.get("database", "")
-            ),
-            user=self.env_loader.get_secret("DB_USER", default=db_data.get("user", "")),
-            password=self.env_loader.get_secret("DB_PASSWORD", default=""),
-            min_connections=self.env_loader.get_int(
-                "DB_MIN_CONNECTIONS", default=db_data.get("min_connection", 5)
-            )
-            or 5,
-            max_connections=self.env_loader.get_int(
-                "DB_MAX_CONNECTIONS", default=db_data.get("max_connection", 10)
-            )
-            or 10,
+            **self._resolve_database_settings(db_data),
             connect_timeout=30,
             app_name="selene",
         )
@@ -106,6 +112,43 @@ class ConfigurationLoader:
             schema=schema_config,
         )
 
+    def _resolve_database_settings(self, db_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve database settings from the environment, falling back to YAML"""
+        resolved: Dict[str, Any] = {}
+        for field_name, env_key, yaml_key, fallback, value_type in _DATABASE_ENV_SPEC:
+            env_value = self.env_loader.get_secret(env_key, required=False)
+            setting: Any
+            if env_value:
+                source = f"Environment variable '{env_key}'"
+                setting = env_value
+            else:
+                source = f"Config key 'database.{yaml_key}'"
+                setting = db_data.get(yaml_key, fallback) if yaml_key else fallback
+                if setting is None:
+                    raise ValueError(f"{source} must not be empty")
+
+            if value_type is int:
+                try:
+                    resolved[field_name] = int(setting) or fallback
+                except (TypeError, ValueError) as exc:
+                    raise ValueError(
+                        f"{source} must be an integer, got: {setting!r}"
+                    ) from exc
+            else:
+                resolved[field_name] = str(setting).strip()
+        return resolved
+
+
+@lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file; cached per file version (path, mtime, size)
+
+    The returned dict is shared by every cache hit; do not mutate it.
+    """
+    with open(path, "rb") as file:
+        parsed: Dict[str, Any] = yaml.load(file, Loader=SafeLoader)
+    return parsed
+
 
 class ConfigurationError(Exception):
     """Custom exception for configuration-related errors"""
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +18,7 @@ class EnvironmentLoader:
         # 1. Load from specific file if provided
         if self.env_file and Path(self.env_file).exists():
             load_dotenv(self.env_file, override=False)
+            self.invalidate()
             return
 
         # 2. Load environment-specific file
@@ -30,25 +32,19 @@ class EnvironmentLoader:
         if Path(".env").exists():
             load_dotenv(".env", override=False)
 
+        # Loaded files may have added variables a cached lookup missed
+        self.invalidate()
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop memoized lookups, e.g. after os.environ was modified"""
+        _resolve_secret.cache_clear()
+
     def get_secret(
         self, key: str, required: bool = True, default: Optional[str] = None
     ) -> str:
         """Get secret from environment with validation"""
-        value = os.getenv(key, default)
-
-        if required and value is None:
-            raise EnvironmentError(f"Required environment variable '{key}' not found")
-
-        if value is None:
-            return default if default is not None else ""
-
-        # Basic validation for common secrets
-        if "KEY" in key and len(value.strip()) < 8:
-            raise ValueError(
-                f"Environment variable '{key}' appears to be too short for a valid key"
-            )
-
-        return value.strip()
+        return _resolve_secret(key, required, default)
 
     def get_int(
         self, key: str, required: bool = True, default: Optional[int] = None
@@ -88,3 +84,23 @@ class EnvironmentLoader:
         )
 
         return [item.strip() for item in value.split(delimiter) if item.strip()]
+
+
+@lru_cache(maxsize=64)
+def _resolve_secret(key: str, required: bool, default: Optional[str]) -> str:
+    """Look up and validate an environment variable; memoized per arguments"""
+    value = os.getenv(key, default)
+
+    if required and value is None:
+        raise EnvironmentError(f"Required environment variable '{key}' not found")
+
+    if value is None:
+        return default if default is not None else ""
+
+    # Basic validation for common secrets
+    if "KEY" in key and len(value.strip()) < 8:
+        raise ValueError(
+            f"Environment variable '{key}' appears to be too short for a valid key"
+        )
+
+    return value.strip()
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from selene.infrastructure.database.db_config import DatabaseConnectionConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """Typed configuration for API settings"""
 
@@ -12,6 +12,7 @@ class APIConfig:
     timeout_seconds: int = 30
     retry_attempts: int = 3
     rate_limit_per_minute: int = 60
+    http2: bool = False  # Use the httpx-based HTTP/2 adapter for bulk fetches
     symbols: list[str] = field(default_factory=list)
 
     def __post_init__(self) -> None:
@@ -23,7 +24,7 @@ class APIConfig:
             raise ValueError("API symbols list cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketDataConfig:
     """Main configuration container for market data application."""
 
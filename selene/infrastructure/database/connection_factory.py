@@ -1,14 +1,20 @@
 import logging
 import threading
+import zlib
 from contextlib import contextmanager
 from tracemalloc import Traceback
 from typing import Any, Dict, Generator, Optional
 
 import psycopg2
 import psycopg2.pool
+from psycopg2.extras import execute_values
 from selene.infrastructure.database.db_config import DatabaseConnectionConfig
 from selene.infrastructure.logging.logger_factory import AppLoggerFactory
 
+# Advisory lock key serializing schema DDL across processes; crc32 keeps it
+# stable between interpreters, unlike the randomized built-in hash()
+SCHEMA_LOCK_KEY = zlib.crc32(b"selene.schema") & 0x7FFFFFFF
+
 
 class PostgresConnectionFactory:
     """Factory for creating and managing database connections."""
@@ -18,48 +24,70 @@ class PostgresConnectionFactory:
     ):
         self.config = config
         self.logger = AppLoggerFactory.create_logger(__name__)
-        self._pool: Optional[psycopg2.pool.SimpleConnectionPool] = None
+        self._pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
         self._lock = threading.Lock()
+        # Per-thread connection held open by unit_of_work()
+        self._local = threading.local()
 
     def initialize(self) -> None:
-        """Initialize the connection pool"""
+        """
+        Initialize the connection pool eagerly and check connectivity
+
+        Optional: get_connection() creates the pool on first use without the
+        version round trip.
+        """
         try:
             with self._lock:
                 if self._pool is not None:
                     self.logger.warning("Connection pool already initialized")
                     return
+                self._create_pool()
 
-                self.logger.info(
-                    "Initializing PostgreSQL connection pool: %d-%d connections",
-                    self.config.min_connections,
-                    self.config.max_connections,
-                )
-
-                self._pool = psycopg2.pool.SimpleConnectionPool(
-                    minconn=self.config.min_connections,
-                    maxconn=self.config.max_connections,
-                    **self.config.to_dict(),
-                )
-
-                # Test the connection
-                self._test_connection()
-                self.logger.info("PostgreSQL connection pool initialized successfully")
+            # Test the connection
+            self._test_connection()
 
         except Exception as e:
             self.logger.error("Failed to initialize connection pool: %s", e)
             raise
 
+    def _get_pool(self) -> psycopg2.pool.ThreadedConnectionPool:
+        """Return the connection pool, creating it on first use"""
+        pool = self._pool
+        if pool is not None:
+            return pool
+
+        # Double-checked so only one thread builds it
+        with self._lock:
+            if self._pool is not None:
+                return self._pool
+            try:
+                return self._create_pool()
+            except Exception as e:
+                self.logger.error("Failed to create connection pool: %s", e)
+                raise
+
+    def _create_pool(self) -> psycopg2.pool.ThreadedConnectionPool:
+        """Create the connection pool; the caller holds self._lock"""
+        self.logger.info(
+            "Initializing PostgreSQL connection pool: %d-%d connections",
+            self.config.min_connections,
+            self.config.max_connections,
+        )
+
+        self._pool = psycopg2.pool.ThreadedConnectionPool(
+            minconn=self.config.min_connections,
+            maxconn=self.config.max_connections,
+            **self.config.to_dict(),
+        )
+        self.logger.info("PostgreSQL connection pool initialized successfully")
+        return self._pool
+
     def _test_connection(self) -> None:
         """Test database connectivity"""
+        # A checked-out connection proves connectivity; server_version is
+        # reported at connect time, so no query is needed
         with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("SELECT version();")
-                version = cursor.fetchone()
-                if version:
-                    version = version[0]
-                else:
-                    version = "Unknown"
-                self.logger.info("Connected to PostgreSQL: %s", version)
+            self.logger.info("Connected to PostgreSQL: %d", conn.server_version)
 
     @contextmanager
     def get_connection(self) -> Generator[psycopg2.extensions.connection, None, None]:
@@ -72,14 +100,23 @@ class PostgresConnectionFactory:
                     cursor.execute("SELECT * FROM users")
                     results = cursor.fetchall()
         """
-        if self._pool is None:
-            raise RuntimeError(
-                "Connection pool not initialized. Call initialize() first."
-            )
+        shared = getattr(self._local, "connection", None)
+        if shared is not None:
+            # Inside unit_of_work(): reuse the held connection, don't return it
+            try:
+                yield shared
+            except Exception as e:
+                self.logger.error("Error in unit of work: %s", e)
+                shared.rollback()
+                raise
+            return
+
+        # Bound once so the connection goes back to the pool it came from
+        pool = self._get_pool()
 
         connection = None
         try:
-            connection = self._pool.getconn()
+            connection = pool.getconn()
             if connection is None:
                 raise RuntimeError("Failed to get connection from pool")
 
@@ -101,11 +138,36 @@ class PostgresConnectionFactory:
                     if connection.status == psycopg2.extensions.STATUS_IN_TRANSACTION:
                         connection.rollback()
 
-                    self._pool.putconn(connection)
+                    pool.putconn(connection)
                     self.logger.debug("Connection returned to pool")
                 except (psycopg2.DatabaseError, psycopg2.InterfaceError) as e:
                     self.logger.error("Error returning connection to pool: %s", e)
 
+    @contextmanager
+    def unit_of_work(self) -> Generator[psycopg2.extensions.connection, None, None]:
+        """
+        Hold a single pooled connection for the current thread
+
+        Every get_connection()/get_cursor() call made inside the block reuses
+        this connection instead of checking one out of the pool per statement.
+
+        Usage:
+            with factory.unit_of_work():
+                market_data_repo.save(data)
+                api_log_repo.save(log_entry)
+        """
+        if getattr(self._local, "connection", None) is not None:
+            # Nested unit of work joins the outer one
+            yield self._local.connection
+            return
+
+        with self.get_connection() as conn:
+            self._local.connection = conn
+            try:
+                yield conn
+            finally:
+                self._local.connection = None
+
     @contextmanager
     def get_cursor(self) -> Generator[psycopg2.extensions.cursor, None, None]:
         """
@@ -125,6 +187,28 @@ class PostgresConnectionFactory:
                     conn.rollback()
                     raise
 
+    def acquire_schema_lock(
+        self, cursor: psycopg2.extensions.cursor, table_name: str
+    ) -> bool:
+        """
+        Take the transaction-scoped schema advisory lock before running DDL
+
+        If another process already holds the lock and ``table_name`` exists,
+        returns False so the caller can skip its DDL. Otherwise waits for the
+        lock and returns True. The lock is released on commit or rollback.
+        """
+        cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", (SCHEMA_LOCK_KEY,))
+        if cursor.fetchone()[0]:
+            return True
+
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (table_name,))
+        if cursor.fetchone()[0]:
+            self.logger.debug("Schema for %s built by another process", table_name)
+            return False
+
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (SCHEMA_LOCK_KEY,))
+        return True
+
     def execute_query(self, query: str, params: tuple) -> Any:
         """
         Execute a SELECT query and return results
@@ -155,20 +239,40 @@ class PostgresConnectionFactory:
             cursor.execute(query, params)
             return cursor.rowcount
 
-    def execute_many(self, query: str, params_list: list) -> Any:
+    def execute_many(
+        self,
+        query: str,
+        params_list: list,
+        template: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Any:
         """
-        Execute query with multiple parameter sets
+        Execute query with multiple parameter sets as multi-row VALUES pages
 
         Args:
-            query: SQL query string
+            query: SQL query with a single VALUES placeholder,
+                e.g. "INSERT INTO t (a, b) VALUES %s"
             params_list: List of parameter tuples
+            template: Optional per-row template, e.g. "(%s, %s::jsonb)"
+            page_size: Rows sent per statement
 
         Returns:
             Number of affected rows
         """
+        # cursor.executemany() issues one statement per row; execute_values
+        # sends ceil(n / page_size) statements instead
         with self.get_cursor() as cursor:
-            cursor.executemany(query, params_list)
-            return cursor.rowcount
+            affected = 0
+            for start in range(0, len(params_list), page_size):
+                execute_values(
+                    cursor,
+                    query,
+                    params_list[start : start + page_size],
+                    template=template,
+                    page_size=page_size,
+                )
+                affected += cursor.rowcount
+            return affected
 
     def get_pool_status(self) -> Dict[str, Any]:
         """Get current pool status"""
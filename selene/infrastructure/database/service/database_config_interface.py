@@ -10,6 +10,9 @@ class DatabaseConfigInterface(ABC):
     classes must implement, regardless of their source or usage.
     """
 
+    # No instance state, so slotted subclasses stay free of a __dict__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def host(self) -> str:
@@ -1,12 +1,41 @@
+import atexit
 import logging
 import logging.handlers  # pylint: disable=import-error
 import os
+import queue
+import re
 import sys
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Literal, Optional
 
+# Level of the main log file; the console level follows verbose/quiet
+FILE_LOG_LEVEL = logging.INFO
+
+
+def _detect_emoji_support() -> bool:
+    """Check if the console can handle emoji characters."""
+    # Windows Terminal and most modern terminals set this
+    if os.getenv("WT_SESSION") or os.getenv("TERM_PROGRAM"):
+        return True
+
+    # Check if stdout is redirected or if we're in a Unicode-compatible console
+    try:
+        encoding = sys.stdout.encoding or ""
+        if encoding.lower().startswith("utf"):
+            return True
+
+        # Try to encode a test emoji to see if it works
+        "🔍".encode(encoding or "utf-8")
+        return True
+    except (UnicodeEncodeError, AttributeError, TypeError):
+        return False
+
+
+# Detected once at import; read without locking by every formatter instance
+_EMOJI_SUPPORT = _detect_emoji_support()
+
 
 class EmojiSafeFormatter(logging.Formatter):
     """Formatter that makes emojis safe for console output."""
@@ -24,10 +53,8 @@ class EmojiSafeFormatter(logging.Formatter):
         "💾": "[SAVE]",
         "🎉": "[COMPLETE]",
     }
-
-    # Cache for emoji support detection
-    _emoji_support_cache = None
-    _cache_lock = threading.Lock()
+    # One pass over the message for all emojis instead of a replace() per emoji
+    _EMOJI_PATTERN = re.compile("|".join(map(re.escape, EMOJI_REPLACEMENTS)))
 
     def __init__(
         self,
@@ -38,49 +65,74 @@ class EmojiSafeFormatter(logging.Formatter):
     ) -> None:
         super().__init__(fmt, datefmt, style, validate)
         # Check if we're running in a Unicode-compatible terminal
-        self.use_emojis = self._check_emoji_support()
-
-    def _check_emoji_support(self) -> bool:
-        """Check if the console can handle emoji characters (cached)."""
-        with self._cache_lock:
-            if self._emoji_support_cache is not None:
-                return self._emoji_support_cache
-
-            # Windows Terminal and most modern terminals set this
-            if os.getenv("WT_SESSION") or os.getenv("TERM_PROGRAM"):
-                self._emoji_support_cache = True
-                return True
-
-            # Check if stdout is redirected or if we're in a Unicode-compatible console
-            try:
-                if sys.stdout.encoding and sys.stdout.encoding.lower() in (
-                    "utf-8",
-                    "utf8",
-                ):
-                    self._emoji_support_cache = True
-                    return True
-
-                # Try to encode a test emoji to see if it works
-                "🔍".encode(sys.stdout.encoding or "utf-8")
-                self._emoji_support_cache = True
-                return True
-            except (UnicodeEncodeError, AttributeError, TypeError):
-                self._emoji_support_cache = False
-                return False
+        self.use_emojis = _EMOJI_SUPPORT
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the record with emoji-safe text."""
         # Get the formatted message from the parent formatter
         formatted_msg = super().format(record)
 
-        # If we can't use emojis, replace them with ASCII equivalents
-        if not self.use_emojis:
-            for emoji, replacement in self.EMOJI_REPLACEMENTS.items():
-                formatted_msg = formatted_msg.replace(emoji, replacement)
+        # If we can't use emojis, replace them with ASCII equivalents; pure
+        # ASCII text (the common case) cannot contain any
+        if not self.use_emojis and not formatted_msg.isascii():
+            formatted_msg = self._EMOJI_PATTERN.sub(
+                lambda match: self.EMOJI_REPLACEMENTS[match.group(0)], formatted_msg
+            )
 
         return formatted_msg
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that flushes its stream in batches, not per record."""
+
+    def __init__(
+        self,
+        filename: str,
+        *args,
+        flush_records: int = 64,
+        flush_interval: float = 0.25,
+        **kwargs,
+    ) -> None:
+        super().__init__(filename, *args, **kwargs)
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self._pending = 0
+        # Flushes a partial batch flush_interval after its first record
+        self._timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record; flush once enough records or time have accumulated."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.flush_records:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        except RecursionError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def flush(self) -> None:
+        # Called from the timer thread as well as from emit() and close()
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            super().flush()
+            self._pending = 0
+        finally:
+            self.release()
+
+
 class AppLoggerFactory:
     """Factory for creating and configuring loggers."""
 
@@ -92,6 +144,13 @@ class AppLoggerFactory:
     _default_stats_file: Optional[Path] = None
     _lock = threading.Lock()
     _configured_loggers: set[str] = set()
+    # Background thread writing queued root-logger records to the real handlers
+    _listener: Optional[logging.handlers.QueueListener] = None
+    # Handlers of the running configuration, kept across settings changes
+    _queue_handler: Optional[logging.handlers.QueueHandler] = None
+    _console_handler: Optional[logging.StreamHandler] = None
+    # Built once by get_stats_logger(); replaced only via reset_stats_logger()
+    _stats_logger: Optional[logging.Logger] = None
 
     @classmethod
     def initialize(cls, verbose: bool = False, quiet: bool = False) -> None:
@@ -114,7 +173,7 @@ class AppLoggerFactory:
                 log_dir = Path(cls._log_dir)
                 log_dir.mkdir(parents=True, exist_ok=True)
 
-                timestamp = datetime.now().strftime("%Y-%m-%d")
+                timestamp = time.strftime("%Y-%m-%d")
                 cls._default_log_file = log_dir / f"selene_{timestamp}.log"
                 cls._default_stats_file = log_dir / f"selene_stats_{timestamp}.log"
 
@@ -148,20 +207,29 @@ class AppLoggerFactory:
 
         Returns:
             Configured logger
+
+        Records below the root level are dropped before a LogRecord is built,
+        but arguments are still evaluated; guard expensive ones with
+        ``if logger.isEnabledFor(logging.DEBUG):``.
         """
-        with cls._lock:
-            if not cls._initialized:
-                cls.initialize()
+        logger = logging.getLogger(name)
 
-            logger = logging.getLogger(name)
+        # Fast path: already configured names need no lock
+        if name in cls._configured_loggers:
+            return logger
 
+        # initialize() takes the lock itself and returns early once done
+        if not cls._initialized:
+            cls.initialize()
+
+        with cls._lock:
             # Only configure if not already configured
             if name not in cls._configured_loggers:
                 # Set propagate to True to use root logger's handlers
                 logger.propagate = True
                 cls._configured_loggers.add(name)
 
-            return logger
+        return logger
 
     @classmethod
     def get_stats_logger(cls) -> logging.Logger:
@@ -171,24 +239,22 @@ class AppLoggerFactory:
         Returns:
             Configured stats logger
         """
+        # Fast path: the handler is attached once and reused
+        if cls._stats_logger is not None:
+            return cls._stats_logger
+
         with cls._lock:
+            if cls._stats_logger is not None:
+                return cls._stats_logger
             if not cls._initialized or cls._default_stats_file is None:
                 raise RuntimeError("Logger factory not initialized")
 
             stats_logger = logging.getLogger("selene.stats")
 
-            # Clear existing handlers safely
-            handlers_to_remove = list(stats_logger.handlers)
-            for handler in handlers_to_remove:
-                stats_logger.removeHandler(handler)
-                try:
-                    handler.close()
-                except OSError:
-                    pass
-
             try:
-                # Use rotating file handler for stats
-                file_handler = logging.handlers.RotatingFileHandler(
+                # Stats arrive in bursts; flush them in batches, not per record.
+                # logging.shutdown() flushes whatever is left at exit
+                file_handler = BufferedRotatingFileHandler(
                     str(cls._default_stats_file),
                     encoding="utf-8",
                     maxBytes=10 * 1024 * 1024,  # 10MB
@@ -201,8 +267,29 @@ class AppLoggerFactory:
             except Exception as e:
                 raise RuntimeError(f"Failed to create stats logger: {e}") from e
 
+            cls._stats_logger = stats_logger
             return stats_logger
 
+    @classmethod
+    def reset_stats_logger(cls) -> None:
+        """
+        Close the stats logger's handlers; the next get_stats_logger() call
+        attaches fresh ones.
+        """
+        with cls._lock:
+            stats_logger = logging.getLogger("selene.stats")
+
+            # Clear existing handlers safely
+            handlers_to_remove = list(stats_logger.handlers)
+            for handler in handlers_to_remove:
+                stats_logger.removeHandler(handler)
+                try:
+                    handler.close()
+                except OSError:
+                    pass
+
+            cls._stats_logger = None
+
     @classmethod
     def configure_root_logger(cls) -> None:
         """
@@ -213,8 +300,12 @@ class AppLoggerFactory:
 
         root_logger = logging.getLogger()
 
-        # Clear existing handlers safely
-        handlers_to_remove = list(root_logger.handlers)
+        # Clear existing handlers safely, except our own running one
+        handlers_to_remove = [
+            handler
+            for handler in root_logger.handlers
+            if handler is not cls._queue_handler
+        ]
         for handler in handlers_to_remove:
             root_logger.removeHandler(handler)
             try:
@@ -222,7 +313,22 @@ class AppLoggerFactory:
             except OSError:
                 pass
 
-        root_logger.setLevel(logging.DEBUG if cls._verbose else logging.INFO)
+        if cls._verbose:
+            console_level = logging.DEBUG
+        elif cls._quiet:
+            console_level = logging.WARNING
+        else:
+            console_level = logging.INFO
+
+        # The root level is the lowest level any handler writes, so records no
+        # handler wants are rejected by isEnabledFor() before a LogRecord exists
+        root_logger.setLevel(min(console_level, FILE_LOG_LEVEL))
+
+        if cls._listener is not None and cls._console_handler is not None:
+            # Settings change only: keep the open log file (and its rotation
+            # byte count) and just adjust the console level
+            cls._console_handler.setLevel(console_level)
+            return
 
         console_formatter = EmojiSafeFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -231,18 +337,10 @@ class AppLoggerFactory:
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
-        if cls._verbose:
-            console_level = logging.DEBUG
-        elif cls._quiet:
-            console_level = logging.WARNING
-        else:
-            console_level = logging.INFO
-
         try:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(console_level)
             console_handler.setFormatter(console_formatter)
-            root_logger.addHandler(console_handler)
 
             # Use rotating file handler for main log
             file_handler = logging.handlers.RotatingFileHandler(
@@ -251,8 +349,47 @@ class AppLoggerFactory:
                 maxBytes=50 * 1024 * 1024,  # 50MB
                 backupCount=3,
             )
-            file_handler.setLevel(logging.INFO)
+            file_handler.setLevel(FILE_LOG_LEVEL)
             file_handler.setFormatter(file_formatter)
-            root_logger.addHandler(file_handler)
+
+            # Callers only enqueue records; console and file I/O happen on the
+            # listener thread
+            log_queue: queue.Queue = queue.Queue(-1)
+            cls._queue_handler = logging.handlers.QueueHandler(log_queue)
+            cls._console_handler = console_handler
+            root_logger.addHandler(cls._queue_handler)
+            cls._listener = logging.handlers.QueueListener(
+                log_queue, console_handler, file_handler, respect_handler_level=True
+            )
+            cls._listener.start()
         except Exception as e:
             raise RuntimeError(f"Failed to configure root logger: {e}") from e
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush queued log records and close the root logger's handlers."""
+        with cls._lock:
+            cls._stop_listener()
+
+    @classmethod
+    def _stop_listener(cls) -> None:
+        """Stop the queue listener, writing out records still queued."""
+        if cls._listener is None:
+            return
+
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            try:
+                handler.close()
+            except OSError:
+                pass
+        cls._listener = None
+        cls._console_handler = None
+        if cls._queue_handler is not None:
+            logging.getLogger().removeHandler(cls._queue_handler)
+            cls._queue_handler = None
+
+
+# Registered after logging's own exit hook, so it runs first and the listener
+# drains its queue before logging.shutdown() closes the handlers
+atexit.register(AppLoggerFactory.shutdown)
@@ -11,6 +11,10 @@ class APILogRepositoryPort(ABC):
     def save(self, log_entry: APILog) -> APILog:
         """Save API log entry"""
 
+    @abstractmethod
+    def save_many(self, entries: List[APILog]) -> List[APILog]:
+        """Save multiple API log entries in one batch"""
+
     @abstractmethod
     def find_recent_errors(self, hours: int = 24) -> List[APILog]:
         """Find recent API errors"""
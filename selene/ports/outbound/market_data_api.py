@@ -11,5 +11,14 @@ class MarketDataAPIPort(ABC):
         """Fetch market data for a given symbol."""
 
     @abstractmethod
-    def get_bulk_market_data(self, symbols: list[str]) -> APIResponse:
-        """Fetch market data for multiple symbols."""
+    def get_bulk_market_data(self, symbols: list[str]) -> list[APIResponse]:
+        """
+        Fetch market data for multiple symbols, in the order given.
+
+        Implementations must not fetch the symbols one after another: either
+        issue a single multi-symbol request or run the per-symbol requests
+        concurrently, within the provider's rate limit.
+        """
+
+    def close(self) -> None:
+        """Release connections and workers held by the adapter."""
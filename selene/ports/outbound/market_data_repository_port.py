@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from selene.domains.market_data.entities.market_data import MarketData
 
@@ -10,6 +10,10 @@ class MarketDataRepositoryPort(ABC):
     def save(self, market_data: MarketData) -> MarketData:
         """Save market data to the repository."""
 
+    @abstractmethod
+    def save_bulk(self, items: List[MarketData]) -> List[MarketData]:
+        """Save multiple market data entries in one batch."""
+
     @abstractmethod
     def update(self, market_data: MarketData) -> MarketData:
         """Update existing market data in the repository."""
@@ -18,6 +22,10 @@ class MarketDataRepositoryPort(ABC):
     def find_by_symbol(self, symbol: str) -> Optional[MarketData]:
         """Find market data by symbol."""
 
+    @abstractmethod
+    def find_by_symbols(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """Find the latest market data for each symbol, keyed by symbol."""
+
     @abstractmethod
     def find_all_recent(self, hours: int = 24) -> List[MarketData]:
         """Find all market data entries created within the last 'hours' hours."""